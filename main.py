@@ -1,10 +1,9 @@
+import re
 import sys
 import qdarkstyle
 from PyQt5.QtWidgets import QApplication, QMainWindow
 from PyQt5.QtGui import QIcon
 from src.gui.process_input_scene import ProcessInputScene
-from src.gui.run_live_scene import RunLiveScene
-from src.gui.run_at_once_scene import RunAtOnceScene
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -20,6 +19,14 @@ class MainWindow(QMainWindow):
         # Set the initial scene as the process input scene
         self.setCentralWidget(self.process_input_scene)
 
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_WHITESPACE_RE = re.compile(r"\s+")
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and collapse whitespace so Qt has less stylesheet text to parse."""
+    qss = _QSS_COMMENT_RE.sub("", qss)
+    return _QSS_WHITESPACE_RE.sub(" ", qss).strip()
+
 def main():
     """Main entry point for the CHRONOS CPU Scheduler application."""
     # Initialize application
@@ -28,7 +35,7 @@ def main():
     # Set application name and metadata
     app.setApplicationName("CHRONOS")
     app.setApplicationDisplayName("CHRONOS")
-    app.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
+    app.setStyleSheet(_minify_qss(qdarkstyle.load_stylesheet_pyqt5()))
     # Create and show main window
     app.setWindowIcon(QIcon('docs/icon.ico'))
     window = ProcessInputScene()
@@ -0,0 +1,15 @@
+import os
+from PyQt5 import uic
+
+UI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PyQtUI")
+
+
+def load_form(file_name: str):
+    """
+    Compile a Designer .ui file from the PyQtUI folder into a form class.
+
+    Scenes call this once at import and mix the result in as a base class,
+    instead of re-parsing the .ui file every time a scene is created.
+    """
+    form_class, _ = uic.loadUiType(os.path.join(UI_DIR, file_name))
+    return form_class
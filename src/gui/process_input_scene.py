@@ -1,7 +1,5 @@
 from PyQt5.QtWidgets import QWidget, QTableWidgetItem
 from PyQt5.QtCore import Qt
-from PyQt5 import uic
-import os
 from src.core.scheduler import Scheduler
 from src.core.simulation import Simulation
 from src.models.process import Process
@@ -11,15 +9,32 @@ from src.algorithms.sjf_non_preemptive import SJFNonPreemptiveScheduler
 from src.algorithms.priority_preemptive import PriorityPreemptiveScheduler
 from src.algorithms.priority_non_preemptive import PriorityNonPreemptiveScheduler
 from src.algorithms.round_robin import RoundRobinScheduler
-
-class ProcessInputScene(QWidget):
+from src.gui.table_utils import bulk_table_update
+from src.gui.form_loader import load_form
+
+_ProcessInputSceneUI = load_form("processInputSceneUI.ui")
+
+# Algorithm combo box texts (as listed in the UI file) that use the priority
+# and time quantum inputs
+_PRIORITY_ALGORITHMS = frozenset({"Priority (Preemptive)", "Priority (Non-Preemptive)"})
+_TIME_QUANTUM_ALGORITHMS = frozenset({"Round Robin"})
+
+# Scheduler classes keyed on the exact algorithm combo box text (Round Robin
+# is handled separately since it needs the time quantum)
+_SCHEDULER_FACTORIES = {
+    "First-Come, First-Served (FCFS)": FCFSScheduler,
+    "Shortest Job First (Preemptive)": SJFPreemptiveScheduler,
+    "Shortest Job First (Non-Preemptive)": SJFNonPreemptiveScheduler,
+    "Priority (Preemptive)": PriorityPreemptiveScheduler,
+    "Priority (Non-Preemptive)": PriorityNonPreemptiveScheduler,
+}
+
+class ProcessInputScene(QWidget, _ProcessInputSceneUI):
     def __init__(self):
         super().__init__()
-        
+
         # Initialize UI first so we can access the combo box
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        ui_file = os.path.join(current_dir, "PyQtUI", "processInputSceneUI.ui")
-        uic.loadUi(ui_file, self)
+        self.setupUi(self)
         self.setWindowTitle("CHRONOS")
         self.showMaximized()
 
@@ -27,6 +42,9 @@ class ProcessInputScene(QWidget):
         # initial_scheduler = self._create_scheduler(self.algorithmComboBox.currentText())
         # self.simulation = Simulation(None)
         self.next_pid = 1  # Add PID counter
+        # (pid, name, arrival time, burst time, priority) of each table row, kept in
+        # row order so runs don't re-parse the table
+        self.process_rows: list[tuple[int, str, int, int, int]] = []
         # self.table_contents = {}  # Store the processes in the table
         # self.editing_row = -1  # Row currently being edited
         # self.currently_editing = False  # Flag to check if we are in editing mode
@@ -52,25 +70,23 @@ class ProcessInputScene(QWidget):
 
     def update_time_quantum_visibility(self):
         # Show time quantum only for Round Robin
-        if(self.algorithmComboBox.currentText() == "Round Robin"):
-            self.timeQuantumSpinBox.setEnabled(True)
-        else:
-            self.timeQuantumSpinBox.setEnabled(False)
+        self.timeQuantumSpinBox.setEnabled(
+            self.algorithmComboBox.currentText() in _TIME_QUANTUM_ALGORITHMS
+        )
 
     def update_priority_visibility(self):
         # Show priority only for Priority Scheduling
-        if("Priority" in self.algorithmComboBox.currentText()):
-            self.prioritySpinBox.setEnabled(True)
-        else:
-            self.prioritySpinBox.setEnabled(False)
+        self.prioritySpinBox.setEnabled(
+            self.algorithmComboBox.currentText() in _PRIORITY_ALGORITHMS
+        )
     
     def on_algorithm_changed(self):
         self.update_time_quantum_visibility()
         self.update_priority_visibility()
-        if "Priority" in self.algorithmComboBox.currentText():
-            self.processTableWidget.setColumnHidden(4, False)  # Show priority column
-        else:
-            self.processTableWidget.setColumnHidden(4, True)  # Hide priority column
+        # Show the priority column only for Priority Scheduling
+        self.processTableWidget.setColumnHidden(
+            4, self.algorithmComboBox.currentText() not in _PRIORITY_ALGORITHMS
+        )
 
     def import_processes(self) -> None:
         """ Import processes from a csv file and add them to the table. """
@@ -79,35 +95,36 @@ class ProcessInputScene(QWidget):
 
         file_dialog = QFileDialog(self)
         file_path, _ = file_dialog.getOpenFileName(self, "Open CSV File", "", "CSV Files (*.csv);;All Files (*)")
-        print(file_path)
         if not file_path:
-            print("No file selected.")
             QMessageBox.warning(self, "Warning", "No file selected.")
             return  # User canceled the dialog
 
         try:
-            print("Importing processes from file...")
-            with open(file_path, mode='r', newline='') as file:
+            with open(file_path, mode='r', newline='', buffering=1 << 20) as file:
                 csv_reader = csv.reader(file)
-                header = next(csv_reader, None)  # Skip the header row if present
-                print(header)
-                for row in csv_reader:
+                next(csv_reader, None)  # Skip the header row if present
 
-                    print(row)
+                # Parse every row first so the table can be grown in one step
+                rows = []
+                for row in csv_reader:
                     name = row[0].strip()
                     arrival_time = int(row[1])
                     burst_time = int(row[2])
                     priority = int(row[3]) if len(row) > 3 else 0  # Default priority to 0 if not provided
-                    
-                    # Update table
-                    row_index = self.processTableWidget.rowCount()
-                    self.processTableWidget.insertRow(row_index)
+                    rows.append((name, arrival_time, burst_time, priority))
+
+            # Update table, with repaints and item signals suspended until all rows are in
+            first_row = self.processTableWidget.rowCount()
+            with bulk_table_update(self.processTableWidget):
+                self.processTableWidget.setRowCount(first_row + len(rows))
+                for row_index, (name, arrival_time, burst_time, priority) in enumerate(rows, first_row):
                     self.processTableWidget.setItem(row_index, 0, QTableWidgetItem(str(self.next_pid)))
                     self.processTableWidget.setItem(row_index, 1, QTableWidgetItem(name))
                     self.processTableWidget.setItem(row_index, 2, QTableWidgetItem(str(arrival_time)))
                     self.processTableWidget.setItem(row_index, 3, QTableWidgetItem(str(burst_time)))
                     self.processTableWidget.setItem(row_index, 4, QTableWidgetItem(str(priority)))
-                    
+                    self.process_rows.append((self.next_pid, name, arrival_time, burst_time, priority))
+
                     # Increment PID counter
                     self.next_pid += 1
 
@@ -136,6 +153,7 @@ class ProcessInputScene(QWidget):
         self.processTableWidget.setItem(row, 2, QTableWidgetItem(str(arrival_time)))
         self.processTableWidget.setItem(row, 3, QTableWidgetItem(str(burst_time)))
         self.processTableWidget.setItem(row, 4, QTableWidgetItem(str(priority)))
+        self.process_rows.append((self.next_pid, name, arrival_time, burst_time, priority))
         
         # Increment PID counter
         self.next_pid += 1
@@ -150,47 +168,30 @@ class ProcessInputScene(QWidget):
     
     def remove_process(self):
         # Remove from table
-        self.processTableWidget.removeRow(self.processTableWidget.selectedItems()[0].row())
+        row = self.processTableWidget.currentRow()
+        if row < 0:
+            return  # Nothing selected
+        self.processTableWidget.removeRow(row)
+        del self.process_rows[row]
 
     def edit_process(self):
         pass
     
     def reset_table(self):
         self.processTableWidget.setRowCount(0)  # Clear all rows in the table
+        self.process_rows.clear()
         self.next_pid = 1
         self.processNameTextBox.setText(f"Process {self.next_pid}")
 
     def get_processes_from_table(self):
-        processes = []
-        for row in range(self.processTableWidget.rowCount()):
-            pid = int(self.processTableWidget.item(row, 0).text())
-            name = self.processTableWidget.item(row, 1).text()
-            arrival_time = int(self.processTableWidget.item(row, 2).text())
-            burst_time = int(self.processTableWidget.item(row, 3).text())
-            priority = int(self.processTableWidget.item(row, 4).text())
-            
-            process = Process(pid, name, arrival_time, burst_time, priority)
-            processes.append(process)
-        
-        return processes
+        # Build fresh processes for every run since the scheduler mutates them
+        return [Process(*row) for row in self.process_rows]
     
     def _create_scheduler(self, algorithm_name: str) -> Scheduler:
         """Create appropriate scheduler based on algorithm name"""
-        if "First-Come, First-Served" in algorithm_name:
-            return FCFSScheduler()
-        elif "Shortest Job First (Preemptive)" in algorithm_name:
-            return SJFPreemptiveScheduler()
-        elif "Shortest Job First (Non-Preemptive)" in algorithm_name:
-            return SJFNonPreemptiveScheduler()
-        elif "Priority (Preemptive)" in algorithm_name:
-            return PriorityPreemptiveScheduler()
-        elif "Priority (Non-Preemptive)" in algorithm_name:
-            return PriorityNonPreemptiveScheduler()
-        elif "Round Robin" in algorithm_name:
-            time_quantum = self.timeQuantumSpinBox.value() if hasattr(self, 'timeQuantumSpinBox') else 2
-            return RoundRobinScheduler(time_quantum)
-        else:
-            return FCFSScheduler()  # Default to FCFS
+        if algorithm_name in _TIME_QUANTUM_ALGORITHMS:
+            return RoundRobinScheduler(self.timeQuantumSpinBox.value())
+        return _SCHEDULER_FACTORIES.get(algorithm_name, FCFSScheduler)()  # Default to FCFS
         
     def goto_run_at_once(self):
         scheduler = self._create_scheduler(self.algorithmComboBox.currentText())
@@ -1,21 +1,20 @@
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QSizePolicy, QTableWidgetItem
-from PyQt5 import uic
 from typing import Generator
-import os
 from src.core.simulation import Simulation
 from src.gui.ganttchart import GanttCanvas
+from src.gui.table_utils import bulk_table_update
 from src.models.process import Process
+from src.gui.form_loader import load_form
 
-class RunAtOnceScene(QWidget):
+_RunAtOnceSceneUI = load_form("runAtOnceSceneUI.ui")
+
+class RunAtOnceScene(QWidget, _RunAtOnceSceneUI):
     def __init__(self,simulation: Simulation):
         super().__init__()
         self.simulation = simulation
-        # Get the directory containing the UI file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        ui_file = os.path.join(current_dir, "PyQtUI", "runAtOnceSceneUI.ui")
-        
+
         # Load the UI
-        uic.loadUi(ui_file, self)
+        self.setupUi(self)
         self.setWindowTitle("CHRONOS")       
         self.showMaximized()
 
@@ -90,23 +89,26 @@ class RunAtOnceScene(QWidget):
         """" Updates the process stable using simulation result from the run_algorithm()"""
 
         processes: list[Process] = self.simulation.scheduler.get_processes()
-        self.processStatsTable.setRowCount(len(processes))  # Set the number of rows in the table
-        
-        for row, process in enumerate(processes):
-            waiting_time = process.get_waiting_time()
-            turnaround_time = process.get_turnaround_time()
-            response_time = process.get_response_time()
-            
-            # Add data to the table
-            self.processStatsTable.setItem(row, 0, QTableWidgetItem(str(process.get_pid())))
-            self.processStatsTable.setItem(row, 1, QTableWidgetItem(process.get_name()))
-            self.processStatsTable.setItem(row, 2, QTableWidgetItem(str(process.get_arrival_time())))
-            self.processStatsTable.setItem(row, 3, QTableWidgetItem(str(process.get_burst_time())))
-            self.processStatsTable.setItem(row, 4, QTableWidgetItem(str(process.get_priority())))
-            self.processStatsTable.setItem(row, 5, QTableWidgetItem(str(process.get_completion_time())))
-            self.processStatsTable.setItem(row, 6, QTableWidgetItem(str(waiting_time)))
-            self.processStatsTable.setItem(row, 7, QTableWidgetItem(str(turnaround_time)))
-            self.processStatsTable.setItem(row, 8, QTableWidgetItem(str(response_time)))
+
+        # Suspend repaints and item signals while filling the table so it is painted once at the end
+        with bulk_table_update(self.processStatsTable):
+            self.processStatsTable.setRowCount(len(processes))  # Set the number of rows in the table
+
+            for row, process in enumerate(processes):
+                waiting_time = process.get_waiting_time()
+                turnaround_time = process.get_turnaround_time()
+                response_time = process.get_response_time()
+
+                # Add data to the table
+                self.processStatsTable.setItem(row, 0, QTableWidgetItem(str(process.get_pid())))
+                self.processStatsTable.setItem(row, 1, QTableWidgetItem(process.get_name()))
+                self.processStatsTable.setItem(row, 2, QTableWidgetItem(str(process.get_arrival_time())))
+                self.processStatsTable.setItem(row, 3, QTableWidgetItem(str(process.get_burst_time())))
+                self.processStatsTable.setItem(row, 4, QTableWidgetItem(str(process.get_priority())))
+                self.processStatsTable.setItem(row, 5, QTableWidgetItem(str(process.get_completion_time())))
+                self.processStatsTable.setItem(row, 6, QTableWidgetItem(str(waiting_time)))
+                self.processStatsTable.setItem(row, 7, QTableWidgetItem(str(turnaround_time)))
+                self.processStatsTable.setItem(row, 8, QTableWidgetItem(str(response_time)))
 
 
     def update_gantt_chart(self):
@@ -1,15 +1,21 @@
 from PyQt5.QtWidgets import QWidget, QTableWidgetItem, QMainWindow, QVBoxLayout
-from PyQt5 import uic
-import os
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from src.core.simulation import Simulation
 from src.models.process import Process
 import threading
+import time
 from src.gui.ganttchart import GanttCanvas
+from src.gui.table_utils import bulk_table_update
+from src.gui.form_loader import load_form
 
+_RunLiveSceneUI = load_form("runLiveSceneUI.ui")
 
 class GanttChartWindow(QMainWindow):
     """A separate window to display the Gantt chart during live simulation."""
-    
+
+    # Emitted from the simulation thread, delivered on the GUI thread
+    redraw_requested = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Live Gantt Chart")
@@ -25,38 +31,59 @@ class GanttChartWindow(QMainWindow):
         # Create the Gantt chart canvas
         self.gantt_canvas = GanttCanvas(self)
         layout.addWidget(self.gantt_canvas)
-        
+
+        # Timeline to plot on the next redraw
+        self.pending_timeline = None
+
+        # Coalesce redraw requests so any burst of updates results in a single plot
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(0)
+        self.redraw_timer.timeout.connect(self.redraw_chart)
+        self.redraw_requested.connect(self.redraw_timer.start)
+
     def update_chart(self, processes_timeline):
-        """Update the Gantt chart with the latest process timeline."""
+        """Schedule a redraw of the Gantt chart with the latest process timeline."""
         if not processes_timeline:
             return
-        
+
+        self.pending_timeline = processes_timeline
+        self.redraw_requested.emit()
+
+    def redraw_chart(self):
+        """Plot the most recently requested timeline."""
+        # Snapshot the timeline since the simulation thread keeps appending to it
+        processes_timeline = list(self.pending_timeline)
+
         try:
             # Update the chart
             self.gantt_canvas.plot_gantt_chart(processes_timeline)
-            
-            # Process events to ensure chart is rendered immediately
-            from PyQt5.QtCore import QCoreApplication
-            QCoreApplication.processEvents()
         except Exception as e:
             print(f"Error updating Gantt chart in separate window: {e}")
 
 
-class RunLiveScene(QWidget):
+class RunLiveScene(QWidget, _RunLiveSceneUI):
     """This class represents the live simulation scene in the gui."""
 
+    # Emitted from the simulation thread with the process that ran this tick
+    process_updated = pyqtSignal(object)
+    # Emitted from the simulation thread once the live run loop exits
+    run_finished = pyqtSignal()
+
     def __init__(self, simulation: Simulation, next_pid: int):
         super().__init__()
-        # Get the directory containing the UI file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        ui_file = os.path.join(current_dir, "PyQtUI", "runLiveSceneUI.ui")
         # Initialize the attributes
         self.simulation: Simulation = simulation
         self.next_pid: int = next_pid
         self.lock = threading.Lock()
         self.gantt_lock = threading.Lock()
+        self.live_thread = None
+        # Latest state of each process touched since the last table refresh
+        self.pending_updates = {}
+        # Table row of each process, so per-tick updates don't scan the table
+        self.pid_rows = {}
         # Load the UI
-        uic.loadUi(ui_file, self)
+        self.setupUi(self)
         self.setWindowTitle("CHRONOS")
         self.showMaximized()
 
@@ -70,159 +97,167 @@ class RunLiveScene(QWidget):
         # self.pauseButton.clicked.connect(self.pause_simulation)  # Pause button
         self.returnToInputSceneButton.clicked.connect(self.return_to_input)
 
+        # Table updates arrive on the GUI thread and are applied at most every 16 ms
+        self.process_updated.connect(self.queue_row_update, Qt.QueuedConnection)
+        self.table_timer = QTimer(self)
+        self.table_timer.setInterval(16)
+        self.table_timer.timeout.connect(self.flush_row_updates)
+        self.run_finished.connect(self.finish_live_run, Qt.QueuedConnection)
+
         # Create the Gantt chart window but don't show it yet
         self.gantt_chart_window = GanttChartWindow(self)
 
         # Create table and populate it
         processes = self.simulation.scheduler.get_processes()
-        self.processStatsTable.setRowCount(len(processes))
-        for row, process in enumerate(processes):
-            # Add a row for each process
-            waiting_time = "N/A"
-            turnaround_time = "N/A"
-            response_time = "N/A"
-            completion_time = "N/A"
-
-            # Add data to the table
-            self.processStatsTable.setItem(
-                row, 0, QTableWidgetItem(str(process.get_pid()))
+
+        # Metrics are not available until the simulation runs
+        not_available = "N/A"
+
+        # Suspend repaints and item signals while filling the table
+        with bulk_table_update(self.processStatsTable):
+            self.processStatsTable.setRowCount(len(processes))
+
+            for row, process in enumerate(processes):
+                self.pid_rows[process.get_pid()] = row
+
+                # Add data to the table
+                self.processStatsTable.setItem(
+                    row, 0, QTableWidgetItem(str(process.get_pid()))
+                )
+                self.processStatsTable.setItem(row, 1, QTableWidgetItem(process.get_name()))
+                self.processStatsTable.setItem(
+                    row, 2, QTableWidgetItem(str(process.get_arrival_time()))
+                )
+                self.processStatsTable.setItem(
+                    row, 3, QTableWidgetItem(str(process.get_priority()))
+                )
+                self.processStatsTable.setItem(
+                    row, 4, QTableWidgetItem(str(process.get_burst_time()))
+                )
+                for column in range(5, 9):
+                    # Completion, waiting, turnaround and response times
+                    self.processStatsTable.setItem(row, column, QTableWidgetItem(not_available))
+
+        if "Priority" not in self.simulation.scheduler.name:
+            # Hide the priority column if the scheduler is not priority-based
+            self.processStatsTable.setColumnHidden(3, True)
+            self.prioritySpinBox.setEnabled(False)  # Disable priority spin box
+
+        self.processNameTextBox.setText(f"Process {self.next_pid}")
+        self.statusTextBox.setText("Ready")
+
+    def add_live_process(self):
+        """Add a live process to the simulation."""
+        # Get the input values from the UI
+        name = self.processNameTextBox.text()
+        burst_time = int(self.burstTimeSpinBox.value())
+        priority = int(self.prioritySpinBox.value())
+        pid = self.next_pid
+
+        if not name:  # If name is empty or only whitespace
+            name = f"Process {pid}"
+
+        # Increment the next PID for the next process
+        self.next_pid += 1
+
+        with self.lock:
+            # Create process and add it to the scheduler
+            self.simulation.add_live_process(
+                pid=pid,
+                name=name,
+                burst_time=burst_time,
+                priority=priority,
             )
-            self.processStatsTable.setItem(row, 1, QTableWidgetItem(process.get_name()))
+
+            # Add process to table
+            row = self.processStatsTable.rowCount()
+            self.processStatsTable.insertRow(row)
+            self.pid_rows[pid] = row
+            self.processStatsTable.setItem(row, 0, QTableWidgetItem(str(pid)))
+            self.processStatsTable.setItem(row, 1, QTableWidgetItem(name))
             self.processStatsTable.setItem(
-                row, 2, QTableWidgetItem(str(process.get_arrival_time()))
-            )
+                row,
+                2,
+                QTableWidgetItem(str(self.simulation.scheduler.get_current_time()))
+            )  # Arrival time is always 0 for live processes
             self.processStatsTable.setItem(
-                row, 3, QTableWidgetItem(str(process.get_priority()))
+                row, 3, QTableWidgetItem(str(priority))
             )
             self.processStatsTable.setItem(
-                row, 4, QTableWidgetItem(str(process.get_burst_time()))
+                row, 4, QTableWidgetItem(str(burst_time))
             )
             self.processStatsTable.setItem(
-                row, 5, QTableWidgetItem(str(completion_time))
-            )
-            self.processStatsTable.setItem(row, 6, QTableWidgetItem(str(waiting_time)))
+                row, 5, QTableWidgetItem(str("N/A"))
+            )  # completion time is not available yet
             self.processStatsTable.setItem(
-                row, 7, QTableWidgetItem(str(turnaround_time))
-            )
-            self.processStatsTable.setItem(row, 8, QTableWidgetItem(str(response_time)))
+                row, 6, QTableWidgetItem("N/A")
+            )  # Waiting time is not available yet
+            self.processStatsTable.setItem(
+                row, 7, QTableWidgetItem("N/A")
+            )  # Turnaround time is not available yet
+            self.processStatsTable.setItem(
+                row, 8, QTableWidgetItem("N/A")
+            )  # Response time is not available yet
 
-            if "Priority" not in self.simulation.scheduler.name:
-                # Hide the priority column if the scheduler is not priority-based
-                self.processStatsTable.setColumnHidden(3, True)
-                self.prioritySpinBox.setEnabled(False)  # Disable priority spin box
+        # Update process name text box with next default name
+        self.processNameTextBox.setText(f"Process {self.next_pid}")
 
-            self.processNameTextBox.setText(f"Process {self.next_pid}")
-            self.statusTextBox.setText("Ready")
+        # Clear the input fieldsets =
+        self.burstTimeSpinBox.setValue(1)
+        self.prioritySpinBox.setValue(0)
 
+        # Turn off creating process flag
+        self.creating_process = False
 
-    def add_live_process(self):
-        """Add a live process to the simulation."""
+    def run_live(self):
+        # Ignore the click if a live run is still in progress
+        if self.live_thread is not None and self.live_thread.is_alive():
+            return
 
-        def add_process_thread():
+        # Show the Gantt chart window when starting the simulation
+        self.gantt_chart_window.show()
+        self.runLiveButton.setEnabled(False)  # Disable the button during simulation
+        self.statusTextBox.setText("Running...")
+        self.table_timer.start()
 
-            # Get the input values from the UI
-            name = self.processNameTextBox.text()
-            burst_time = int(self.burstTimeSpinBox.value())
-            priority = int(self.prioritySpinBox.value())
-            pid = self.next_pid
+        self.live_thread = threading.Thread(target=self._run_live_thread, daemon=True)
+        self.live_thread.start()
 
-            if not name:  # If name is empty or only whitespace
-                name = f"Process {pid}"
-            
-            # Increment the next PID for the next process
-            self.next_pid += 1
+    def _run_live_thread(self):
+        live_simulation = None
+        self.simulation.start()
 
+        while self.simulation.is_running() and not self.simulation.is_paused():
+            # Lock the simulation to prevent concurrent access
             with self.lock:
-                # Create process and add it to the scheduler
-                self.simulation.add_live_process(
-                    pid=pid,
-                    name=name,
-                    burst_time=burst_time,
-                    priority=priority,
-                )
-
-                # Add process to table
-                row = self.processStatsTable.rowCount()
-                self.processStatsTable.insertRow(row)
-                self.processStatsTable.setItem(row, 0, QTableWidgetItem(str(pid)))
-                self.processStatsTable.setItem(row, 1, QTableWidgetItem(name))
-                self.processStatsTable.setItem(
-                    row,
-                    2,
-                    QTableWidgetItem(str(self.simulation.scheduler.get_current_time()))
-                )  # Arrival time is always 0 for live processes
-                self.processStatsTable.setItem(
-                    row, 3, QTableWidgetItem(str(priority))
-                )
-                self.processStatsTable.setItem(
-                    row, 4, QTableWidgetItem(str(burst_time))
-                )
-                self.processStatsTable.setItem(
-                    row, 5, QTableWidgetItem(str("N/A"))
-                )  # completion time is not available yet
-                self.processStatsTable.setItem(
-                    row, 6, QTableWidgetItem("N/A")
-                )  # Waiting time is not available yet
-                self.processStatsTable.setItem(
-                    row, 7, QTableWidgetItem("N/A")
-                )  # Turnaround time is not available yet
-                self.processStatsTable.setItem(
-                    row, 8, QTableWidgetItem("N/A")
-                )  # Response time is not available yet
+                if not live_simulation:
+                    # Tick without the built-in delay so the lock isn't held while sleeping
+                    live_simulation = self.simulation._run_simulation(False)
+                try:
+                    current_process = next(live_simulation)
+                except StopIteration as e:
+                    current_process = e.value
+                    break
 
-            # Update process name text box with next default name
-            self.processNameTextBox.setText(f"Process {self.next_pid}")
+            # Queue the current process for the next table refresh
+            if current_process is not None:
+                self.process_updated.emit(current_process)
 
-            # Clear the input fieldsets =
-            self.burstTimeSpinBox.setValue(1)
-            self.prioritySpinBox.setValue(0)
-            
-            # Turn off creating process flag
-            self.creating_process = False
+            # Update the Gantt chart with the current process
+            with self.gantt_lock:
+                self.simulation.processes_timeline.append(current_process)
+                self.update_gantt_chart()
 
-        threading.Thread(target=add_process_thread, daemon=True).start()
-
-    def run_live(self):
-        # Show the Gantt chart window when starting the simulation
-        self.gantt_chart_window.show()
-        
-        def run_live_thread():
-            live_simulation = None
-            self.simulation.start()
-            self.runLiveButton.setEnabled(False)  # Disable the button during simulation
-            self.statusTextBox.setText("Running...")
-
-            while self.simulation.is_running() and not self.simulation.is_paused():
-                # Lock the simulation to prevent concurrent access
-                with self.lock:
-                    if not live_simulation:
-                        live_simulation = self.simulation._run_simulation(True)
-                    try:
-                        current_process = next(live_simulation)
-                    except StopIteration as e:
-                        current_process = e.value
-                        break
-
-                # Updates current process in the table
-                self.update_row_per_tick(current_process)
-
-                # Update the Gantt chart with the current process
-                with self.gantt_lock:
-                    self.simulation.processes_timeline.append(current_process)
-                    self.update_gantt_chart()
-
-                if self.simulation.scheduler.all_processes_completed():
-                    # All processes are completed, show final Gantt chart
-                    self.update_gantt_chart()
-                    self.averageWaitingTimeTextBox.setText(str(self.simulation.scheduler.get_average_waiting_time()))
-                    self.averageTurnaroundTimeTextBox.setText(str(self.simulation.scheduler.get_average_turnaround_time()))
-                    # self.statusTextBox.setText("Done")
+            if self.simulation.scheduler.all_processes_completed():
+                # All processes are completed, show final Gantt chart
+                self.update_gantt_chart()
+                break
 
-                    break
-            self.statusTextBox.setText("Done")
-            self.runLiveButton.setEnabled(True)  # Enable the button during simulation
+            # Wait between ticks outside the lock so adding a live process doesn't block
+            time.sleep(self.simulation.delay)
 
-        threading.Thread(target=run_live_thread, daemon=True).start()
+        # Final stats are filled in on the GUI thread, after the queued table updates
+        self.run_finished.emit()
 
     def pause_simulation(self):
         """Pause the simulation."""
@@ -240,6 +275,27 @@ class RunLiveScene(QWidget):
         self.return_to_input_scene.show()
         self.close()
 
+    def queue_row_update(self, process: Process) -> None:
+        """Remember the latest state of a process until the next table refresh."""
+        self.pending_updates[process.get_pid()] = process
+
+    def flush_row_updates(self) -> None:
+        """Apply the queued process updates to the table in one pass."""
+        pending, self.pending_updates = self.pending_updates, {}
+        for process in pending.values():
+            self.update_row_per_tick(process)
+
+    def finish_live_run(self) -> None:
+        """Show the final table state and averages once the live run has ended."""
+        self.table_timer.stop()
+        self.flush_row_updates()
+
+        if self.simulation.scheduler.all_processes_completed():
+            self.averageWaitingTimeTextBox.setText(str(self.simulation.scheduler.get_average_waiting_time()))
+            self.averageTurnaroundTimeTextBox.setText(str(self.simulation.scheduler.get_average_turnaround_time()))
+        self.statusTextBox.setText("Done")
+        self.runLiveButton.setEnabled(True)  # Enable the button after simulation
+
     def update_row_per_tick(self, process: Process) -> None:
         """
         Update the process table with the current process information.
@@ -247,35 +303,20 @@ class RunLiveScene(QWidget):
         if process is None:
             return  # No process to update
 
-        pid: int = process.get_pid()
-        # find row in table with the given pid
-        for row in range(self.processStatsTable.rowCount()):
-            if int(self.processStatsTable.item(row, 0).text()) == pid:
-                # Update waiting time, turnaround time, and response time
-                burst_time: int = process.get_remaining_time()
-                self.processStatsTable.setItem(
-                    row, 4, QTableWidgetItem(str(burst_time))
-                )
+        row = self.pid_rows.get(process.get_pid())
+        if row is None:
+            return  # Process is not in the table
 
-                if burst_time == 0:
-                    waiting_time = process.get_waiting_time()
-                    turnaround_time = process.get_turnaround_time()
-                    response_time = process.get_response_time()
-
-                    self.processStatsTable.setItem(
-                        row, 5, QTableWidgetItem(str(process.get_completion_time()))
-                    )
-                    self.processStatsTable.setItem(
-                        row, 6, QTableWidgetItem(str(waiting_time))
-                    )
-                    self.processStatsTable.setItem(
-                        row, 7, QTableWidgetItem(str(turnaround_time))
-                    )
-                    self.processStatsTable.setItem(
-                        row, 8, QTableWidgetItem(str(response_time))
-                    )
-                self.processStatsTable.viewport().update()
-                break
+        # Update the existing cells in place instead of allocating new items
+        burst_time: int = process.get_remaining_time()
+        self.processStatsTable.item(row, 4).setText(str(burst_time))
+
+        if burst_time == 0:
+            # Update completion, waiting, turnaround and response times
+            self.processStatsTable.item(row, 5).setText(str(process.get_completion_time()))
+            self.processStatsTable.item(row, 6).setText(str(process.get_waiting_time()))
+            self.processStatsTable.item(row, 7).setText(str(process.get_turnaround_time()))
+            self.processStatsTable.item(row, 8).setText(str(process.get_response_time()))
 
     def update_gantt_chart(self):
         """
@@ -0,0 +1,22 @@
+from contextlib import contextmanager
+from PyQt5.QtWidgets import QTableWidget
+
+
+@contextmanager
+def bulk_table_update(table: QTableWidget):
+    """
+    Suspend sorting, repaints and item signals on a table while it is filled,
+    so the whole batch results in a single layout and paint.
+    """
+    # Remember the previous state so nested or pre-suspended tables are restored as found
+    sorting_enabled = table.isSortingEnabled()
+    updates_enabled = table.updatesEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    was_blocked = table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(was_blocked)
+        table.setUpdatesEnabled(updates_enabled)
+        table.setSortingEnabled(sorting_enabled)